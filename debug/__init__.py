@@ -1,21 +1,143 @@
 import os
+import sys
+import atexit
 import time
-import traceback
-import inspect
 import threading
 import json
-from datetime import datetime
-from urllib import request
+import string
+import functools
+import heapq
+import itertools
+import traceback
+from collections import deque
+from http.client import HTTPConnection, HTTPSConnection
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
 __all__ = [
-    "log", "watch", "assert_log", "timeit", "configure", "set_tags",
+    "log", "info", "debug", "warn", "error", "timer", "watch", "assert_log", "timeit", "configure", "set_tags",
     "clear_tags", "enable_level", "disable_level", "enable_stack",
     "disable_stack", "enable_colors", "disable_colors", "set_output",
     "set_format", "set_whitelist", "set_filters", "enable_json",
     "disable_json", "enable_remote", "disable_remote", "set_remote_url",
-    "get_logger"
+    "flush", "close", "get_logger"
 ]
 
+_CONSOLE_MODES = frozenset({"console", "both"})
+_FILE_MODES = frozenset({"file", "both"})
+_UTF8_NAMES = frozenset({"utf-8", "utf8"})
+
+def _json_dumps(obj):
+    try:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    except UnicodeEncodeError:
+        # lone surrogates: fall back to \u escapes rather than failing the log call
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+if orjson is not None:
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj)
+        except TypeError:  # orjson.JSONEncodeError; e.g. non-str keys or invalid UTF-8
+            return _json_dumps(obj)
+else:
+    _dumps = _json_dumps
+
+def _caller_frame(depth):
+    try:
+        return sys._getframe(depth + 1)
+    except ValueError:
+        return None
+
+def _format_stack(frame, limit=5):
+    lines = []
+    while frame is not None and len(lines) < limit:
+        code = frame.f_code
+        lines.append(f'  File "{code.co_filename}", line {frame.f_lineno}, in {code.co_name}\n')
+        frame = frame.f_back
+    return "".join(reversed(lines))
+
+@functools.lru_cache(maxsize=256)
+def _tag_str(tags):
+    return f"[{','.join(sorted(tags))}]"
+
+class _WatchPairs:
+    __slots__ = ("items",)
+
+    def __init__(self, items):
+        self.items = items
+
+    def __str__(self):
+        return ", ".join(f"{k}={v!r}" for k, v in self.items.items())
+
+class _LogWorker(threading.Thread):
+    def __init__(self, logger):
+        super().__init__(name="DebugLoggerWorker", daemon=True)
+        self.logger = logger
+        self.running = True
+
+    def run(self):
+        logger = self.logger
+        while self.running:
+            # Sleep until a record arrives (or a pending remote batch is due),
+            # then give other records flush_interval_ms to pile up.
+            logger._event.wait(logger.remote_batch_interval if logger._remote_batch else None)
+            logger._event.clear()
+            if self.running and logger.flush_interval_ms:
+                logger._urgent.wait(logger.flush_interval_ms / 1000)  # FLUSH_LEVELS cut this short
+            logger._urgent.clear()
+            try:
+                logger._drain()
+            except Exception:
+                logger._report_error()  # keep the writer alive
+
+class _RemoteSender(threading.Thread):
+    MAX_PENDING = 100  # batches; the oldest are dropped if the endpoint falls behind
+
+    def __init__(self, logger):
+        super().__init__(name="DebugLoggerRemote", daemon=True)
+        self.logger = logger
+        self.queue = deque(maxlen=self.MAX_PENDING)
+        self.cond = threading.Condition()
+        self.busy = False
+        self.running = True
+
+    def submit(self, url, body):
+        with self.cond:
+            self.queue.append((url, body))
+            self.cond.notify_all()
+
+    def stop(self):
+        with self.cond:
+            self.running = False
+            self.cond.notify_all()
+
+    def wait_idle(self, timeout):
+        with self.cond:
+            self.cond.wait_for(lambda: not self.queue and not self.busy, timeout)
+
+    def run(self):
+        logger = self.logger
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self.queue or not self.running)
+                if not self.queue:
+                    break
+                url, body = self.queue.popleft()
+                self.busy = True
+            try:
+                logger._send_remote(url, body)
+            except Exception:
+                logger._report_error()
+            with self.cond:
+                self.busy = False
+                self.cond.notify_all()
+        logger._close_remote()
+
 class DebugLogger:
     COLOR_CODES = {
         "reset": "\033[0m",
@@ -37,70 +159,396 @@ class DebugLogger:
         "TIMER": "magenta"
     }
 
+    FORMAT_FIELDS = ("time", "level", "location", "tags", "message")
+    FLUSH_LEVELS = frozenset({"WARN", "ERROR"})
+    FILE_BUFFER_SIZE = 64 * 1024
+    QUEUE_SIZE = 10000
+    CODE_CACHE_SIZE = 512
+    LOCATION_CACHE_SIZE = 256
+
     def __init__(self):
         self.lock = threading.Lock()
-        self.tags = set()
+        self.tags = frozenset()
         self.filters = {
-            "modules": set(),
-            "functions": set(),
-            "levels": set(),
-            "tags": set()
+            "modules": frozenset(),
+            "functions": frozenset(),
+            "levels": frozenset(),
+            "tags": frozenset()
         }
         self.output = "console"  # console, file, both, callback
         self.callback = None
-        self.whitelist = set()
+        self._callback_lock = threading.Lock()
+        self.whitelist = frozenset()
         self.log_file = "debug.log"
         self.use_colors = True
         self.include_stack = False
-        self.enabled_levels = {"INFO", "DEBUG", "WARN", "ERROR", "TIMER"}
+        self.enabled_levels = frozenset({"INFO", "DEBUG", "WARN", "ERROR", "TIMER"})
         self.log_format = "[{time}] [{level}] {location} {tags} - {message}"
         self.json_output = False
         self.remote_enabled = False
         self.remote_url = None
+        self.flush_interval_ms = 10
+        self.flush_max_records = 512
+        self.remote_batch_size = 100
+        self.remote_batch_interval = 0.5  # seconds
+        self._remote_batch = []
+        self._remote_batch_started = 0.0
+        self._time_cache = (None, "")
+        self._code_cache = {}
+        self._location_cache = {}
+        self._fh = None
+        self._fh_path = None
+        self._remote_conn = None  # owned by the _RemoteSender thread
+        self._remote_target = None
+        self._sender = None
+        self._tls = threading.local()
+        self._queues = []  # (thread, deque) per producing thread
+        self._queues_lock = threading.Lock()
+        self._seq = itertools.count()
+        self._event = threading.Event()
+        self._urgent = threading.Event()
+        self._worker = None
+        self._dropped = 0
+        self._version = 0
+        for level in self.LEVEL_COLORS:
+            setattr(self, level.lower(), self._make_leveled(level))
+        self._refresh()
+        atexit.register(self.close)
+
+    def _refresh(self):
+        self._level_prefix = {
+            level: self.COLOR_CODES[color]
+            for level, color in self.LEVEL_COLORS.items() if color in self.COLOR_CODES
+        }
+        self.tags = frozenset(self.tags)
+        self.whitelist = frozenset(self.whitelist)
+        self.enabled_levels = frozenset(self.enabled_levels)
+        f = self.filters
+        for key, values in f.items():
+            f[key] = frozenset(values)
+        self._passes_filters = self._build_filter()
+        self._filters_active = bool(
+            self.whitelist or f["modules"] or f["functions"] or f["levels"] or f["tags"]
+        )
+        self._render = self._compile_format(self.log_format)
+        # Colored levels get their own render with the escape codes compiled in.
+        reset = self.COLOR_CODES.get("reset", "")
+        self._level_render = {
+            level: self._compile_format(self.log_format, prefix, reset)
+            for level, prefix in self._level_prefix.items()
+        } if self.use_colors else {}
+        self._version += 1  # tells BoundLogger snapshots to rebind
+
+    def _compile_format(self, format_str, prefix="", suffix=""):
+        # Specialise the template into an f-string function, so records skip str.format.
+        source = self._format_source(format_str, prefix, suffix)
+        if source is not None:
+            namespace = {"__builtins__": {}}
+            try:
+                exec(source, namespace)
+                return namespace["render"]
+            except SyntaxError:
+                pass
+
+        def render(time, level, location, tags, message):
+            return prefix + format_str.format(
+                time=time, level=level, location=location, tags=tags, message=message
+            ) + suffix
+        return render
+
+    def _format_source(self, format_str, prefix="", suffix=""):
+        def literal_text(text):
+            return text.replace("{", "{{").replace("}", "}}")
+
+        pieces = [literal_text(prefix)]
+        try:
+            parsed = list(string.Formatter().parse(format_str))
+        except ValueError:
+            return None  # let str.format report the broken template when logging
+        for literal, field, spec, conversion in parsed:
+            pieces.append(literal_text(literal))
+            if field is None:
+                continue
+            if field not in self.FORMAT_FIELDS or "{" in spec:
+                return None
+            pieces.append("{%s%s%s}" % (
+                field, "!" + conversion if conversion else "", ":" + spec if spec else ""
+            ))
+        pieces.append(literal_text(suffix))
+        return "def render(%s):\n    return f%r\n" % (", ".join(self.FORMAT_FIELDS), "".join(pieces))
 
-    def _colorize(self, text, color):
-        if self.use_colors and color in self.COLOR_CODES:
-            return f"{self.COLOR_CODES[color]}{text}{self.COLOR_CODES['reset']}"
-        return text
+    def _code_info(self, frame):
+        code = frame.f_code
+        info = self._code_cache.get(code)
+        if info is None:
+            if len(self._code_cache) >= self.CODE_CACHE_SIZE:
+                self._code_cache.clear()
+            info = (frame.f_globals.get("__name__", "?"), os.path.basename(code.co_filename))
+            self._code_cache[code] = info
+        return info
 
-    def _get_location(self, skip=3):
-        frame = inspect.stack()[skip]
-        module = inspect.getmodule(frame[0])
-        filename = os.path.basename(module.__file__) if module and hasattr(module, '__file__') else "?"
-        return f"{filename}:{frame.lineno} in {frame.function}()"
+    def _location(self, frame):
+        if frame is None:
+            return "?"
+        key = (frame.f_code, frame.f_lineno)
+        location = self._location_cache.get(key)
+        if location is None:
+            if len(self._location_cache) >= self.LOCATION_CACHE_SIZE:
+                self._location_cache.clear()
+            location = f"{self._code_info(frame)[1]}:{frame.f_lineno} in {frame.f_code.co_name}()"
+            self._location_cache[key] = location
+        return location
 
-    def _passes_filters(self, level, module_name, function_name, tags):
+    def _timestamp(self):
+        now = time.time()
+        sec = int(now)
+        cached_sec, prefix = self._time_cache
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            self._time_cache = (sec, prefix)
+        return f"{prefix}.{int((now - sec) * 1000):03d}"
+
+    def _build_filter(self):
         f = self.filters
-        return (
-            (not f["levels"] or level in f["levels"]) and
-            (not f["modules"] or module_name in f["modules"]) and
-            (not f["functions"] or function_name in f["functions"]) and
-            (not f["tags"] or bool(f["tags"] & tags))
-        )
+        levels, modules, functions, tags = f["levels"], f["modules"], f["functions"], f["tags"]
+        checks = [
+            check for active, check in (
+                (levels, lambda l, m, fn, t: l in levels),
+                (modules, lambda l, m, fn, t: m in modules),
+                (functions, lambda l, m, fn, t: fn in functions),
+                (tags, lambda l, m, fn, t: not tags.isdisjoint(t)),
+            ) if active
+        ]
+        if not checks:
+            return lambda l, m, fn, t: True
+        if len(checks) == 1:
+            return checks[0]
+
+        def passes(level, module_name, function_name, record_tags):
+            return (
+                (not levels or level in levels) and
+                (not modules or module_name in modules) and
+                (not functions or function_name in functions) and
+                (not tags or not tags.isdisjoint(record_tags))
+            )
+        return passes
+
+    def _open_file(self):
+        if self._fh is None or self._fh_path != self.log_file:
+            self._close_file()
+            self._fh = open(self.log_file, "ab", buffering=self.FILE_BUFFER_SIZE)
+            self._fh_path = self.log_file
+        return self._fh
 
-    def _write(self, data: str, json_data: dict = None):
+    def _close_file(self):
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+            self._fh_path = None
+
+    def _start_worker(self):
         with self.lock:
-            if self.output in {"console", "both"}:
-                print(data)
-            if self.output in {"file", "both"}:
-                with open(self.log_file, "a", encoding="utf-8") as f:
-                    f.write(data + "\n")
-            if self.output == "callback" and self.callback:
-                self.callback(data)
-            if self.remote_enabled and self.remote_url and json_data:
-                threading.Thread(target=self._send_remote, args=(json_data,)).start()
-
-    def _send_remote(self, payload):
+            if self._worker is None:
+                worker = _LogWorker(self)
+                try:
+                    worker.start()
+                except RuntimeError:
+                    return False  # interpreter shutting down
+                self._worker = worker
+        return True
+
+    def _stop_worker(self):
+        worker = self._worker
+        if worker is not None:
+            worker.running = False
+            self._event.set()
+            if worker is not threading.current_thread():
+                worker.join(timeout=5)
+            self._worker = None
+
+    def _thread_queue(self):
+        queue = deque(maxlen=self.QUEUE_SIZE)
+        with self._queues_lock:
+            self._queues.append((threading.current_thread(), queue))
+        self._tls.queue = queue
+        return queue
+
+    def _report_error(self):
+        # Like logging.Handler.handleError: a failing sink is reported, never raised.
+        if sys.stderr is None:
+            return
         try:
-            req = request.Request(self.remote_url, method="POST")
-            req.add_header("Content-Type", "application/json")
-            request.urlopen(req, data=json.dumps(payload).encode("utf-8"), timeout=5)
+            sys.stderr.write("--- DebugLogger error ---\n")
+            traceback.print_exc(file=sys.stderr)
         except Exception:
-            pass  # don't crash if remote fails
+            pass
 
-    def _format(self, level, message, tags, location, stack=None):
-        tag_str = f"[{','.join(sorted(tags))}]" if tags else ""
-        log_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+    def _write(self, data: bytes, json_data: bytes = None, flush=False):
+        # The callback sink runs inline, so callers see records as soon as log() returns.
+        callback = self.callback if self.output == "callback" else None
+        if callback is None or (json_data and self.remote_enabled):
+            self._enqueue(data, json_data, flush)
+        if callback is not None:
+            with self._callback_lock:
+                callback(data.decode("utf-8"))
+
+    def _enqueue(self, data, json_data, flush):
+        try:
+            queue = self._tls.queue
+        except AttributeError:
+            queue = self._thread_queue()
+        if len(queue) == queue.maxlen:
+            self._dropped += 1
+        # deque.append is atomic, so producers never take a lock here
+        queue.append((next(self._seq), data, json_data))
+        if self._worker is None and not self._start_worker():
+            self._drain()
+            return
+        if flush:
+            self._urgent.set()
+            self._event.set()
+        elif not self._event.is_set():
+            self._event.set()
+
+    def _collect(self):
+        with self._queues_lock:
+            queues = list(self._queues)
+        batches = []
+        for thread, queue in queues:
+            batch = []
+            while queue:
+                batch.append(queue.popleft())
+            if batch:
+                batches.append(batch)
+            elif not thread.is_alive():
+                with self._queues_lock:
+                    self._queues.remove((thread, queue))
+        # Each thread's batch is already in sequence order; merge them back into one.
+        merged = heapq.merge(*batches) if len(batches) > 1 else batches[0] if batches else ()
+        return [(data, json_data) for _, data, json_data in merged]
+
+    def _drain(self, force=False):
+        with self.lock:
+            records = []
+            if self._dropped:
+                dropped, self._dropped = self._dropped, 0
+                # Formatted like any other record, so JSON-lines output stays parseable.
+                notice = f"[logging buffer full: {dropped} records dropped]"
+                records.append(self._format("WARN", notice, (), frozenset(), "?"))
+            records.extend(self._collect())
+            step = max(1, self.flush_max_records)
+            for start in range(0, len(records), step):
+                self._emit(records[start:start + step])
+            if records and self._fh is not None and self.output in _FILE_MODES:
+                try:
+                    self._fh.flush()  # once per tick, so tail -f and crashes see every line
+                except Exception:
+                    self._report_error()
+            if self._remote_batch and (
+                force or time.monotonic() - self._remote_batch_started >= self.remote_batch_interval
+            ):
+                self._flush_remote()
+
+    def _emit(self, records):
+        output = self.output
+        if output in _CONSOLE_MODES or output in _FILE_MODES:
+            chunk = b"\n".join([data for data, _ in records]) + b"\n"
+            if output in _CONSOLE_MODES:
+                try:
+                    self._write_console(chunk)
+                except Exception:
+                    self._report_error()
+            if output in _FILE_MODES:
+                try:
+                    fh = self._open_file()
+                    fh.write(chunk)
+                except Exception:
+                    self._report_error()
+        if self.remote_enabled and self.remote_url:
+            batch = self._remote_batch
+            for _, json_data in records:
+                if json_data:
+                    if not batch:
+                        self._remote_batch_started = time.monotonic()
+                    batch.append(json_data)
+                    if len(batch) >= self.remote_batch_size:
+                        self._flush_remote()
+                        batch = self._remote_batch
+
+    def _write_console(self, chunk):
+        stream = sys.stdout
+        buffer = getattr(stream, "buffer", None)
+        if buffer is None or (getattr(stream, "encoding", None) or "").lower() not in _UTF8_NAMES:
+            stream.write(chunk.decode("utf-8"))
+            stream.flush()
+            return
+        stream.flush()  # keep ordering with text already written through print()
+        buffer.write(chunk)
+        buffer.flush()
+
+    def _flush_remote(self):
+        # Hand the batch to the sender thread, so a slow endpoint never holds up
+        # console/file output or anything waiting on self.lock.
+        batch, self._remote_batch = self._remote_batch, []
+        if not self.remote_url:
+            return
+        body = b"[" + b",".join(batch) + b"]"
+        if self._sender is None:
+            sender = _RemoteSender(self)
+            try:
+                sender.start()
+            except RuntimeError:
+                self._send_remote(self.remote_url, body)  # interpreter shutting down
+                return
+            self._sender = sender
+        self._sender.submit(self.remote_url, body)
+
+    def _stop_sender(self):
+        sender = self._sender
+        if sender is not None:
+            sender.stop()
+            if sender is not threading.current_thread():
+                sender.join(timeout=5)
+            self._sender = None
+
+    def _remote_connection(self, remote_url):
+        url = urlsplit(remote_url)
+        if self._remote_conn is None or self._remote_target != (url.scheme, url.netloc):
+            self._close_remote()
+            conn_cls = HTTPSConnection if url.scheme == "https" else HTTPConnection
+            self._remote_conn = conn_cls(url.netloc, timeout=5)
+            self._remote_target = (url.scheme, url.netloc)
+        path = url.path or "/"
+        if url.query:
+            path += "?" + url.query
+        return self._remote_conn, path
+
+    def _close_remote(self):
+        if self._remote_conn is not None:
+            self._remote_conn.close()
+            self._remote_conn = None
+            self._remote_target = None
+
+    def _send_remote(self, remote_url, body):
+        for attempt in range(2):
+            try:
+                conn, path = self._remote_connection(remote_url)
+                conn.request("POST", path, body=body, headers={
+                    "Content-Type": "application/json",
+                    "Connection": "keep-alive"
+                })
+                conn.getresponse().read()
+                return
+            except ConnectionError:
+                self._close_remote()  # the server may have dropped an idle connection; retry once
+            except Exception:
+                self._close_remote()  # don't crash if remote fails
+                return
+
+    def _format(self, level, message, args, tags, location, stack=None):
+        if args:
+            message = message % args
+        log_time = self._timestamp()
         if self.json_output:
             payload = {
                 "timestamp": log_time,
@@ -110,47 +558,62 @@ class DebugLogger:
                 "message": message,
                 "stack": stack if stack else None
             }
-            return json.dumps(payload), payload
-        else:
-            formatted = self.log_format.format(
-                time=log_time,
-                level=level,
-                location=location,
-                message=message,
-                tags=tag_str
-            )
-            return self._colorize(formatted, self.LEVEL_COLORS.get(level, "")), None
+            json_line = _dumps(payload)
+            return json_line, json_line
+
+        tag_str = _tag_str(tags) if tags else ""
+        render = self._level_render.get(level, self._render)
+        formatted = render(log_time, level, location, tag_str, message)
+        return formatted.encode("utf-8", "backslashreplace"), None
+
+    def _make_leveled(self, level):
+        def leveled(message, *args, tags=None, include_stack=None):
+            if level not in self.enabled_levels:
+                return
+            self._log_impl(level, message, args, tags, include_stack)
+        leveled.__name__ = leveled.__qualname__ = level.lower()
+        return leveled
 
     def log(self, message, *args, level="INFO", tags=None, include_stack=None):
         if level not in self.enabled_levels:
             return
+        self._log_impl(level, message, args, tags, include_stack)
 
-        caller = inspect.stack()[2]
-        module = inspect.getmodule(caller[0])
-        module_name = module.__name__ if module else "?"
-        func_name = caller.function
-        if self.whitelist and module_name not in self.whitelist:
-            return
-        all_tags = self.tags.union(tags or set())
-        if not self._passes_filters(level, module_name, func_name, all_tags):
-            return
+    def _log_impl(self, level, message, args, tags, include_stack, module=None, base_tags=None):
+        # Called one frame below log(), the per-level methods and BoundLogger.
+        if base_tags is None:
+            base_tags = self.tags
+        if not tags:
+            all_tags = base_tags
+        elif not base_tags:
+            # frozensets are hashable, so _format can cache the rendered tag string
+            all_tags = tags if isinstance(tags, frozenset) else frozenset(tags)
+        else:
+            all_tags = base_tags.union(tags)
 
-        location = self._get_location()
-        message = message % args if args else message
+        frame = _caller_frame(3)
+        if self._filters_active:
+            module_name = module or (self._code_info(frame)[0] if frame else "?")
+            func_name = frame.f_code.co_name if frame else "?"
+            if self.whitelist and module_name not in self.whitelist:
+                return
+            if not self._passes_filters(level, module_name, func_name, all_tags):
+                return
+
+        location = self._location(frame)
         stack = None
         if include_stack or (include_stack is None and self.include_stack):
-            stack = "".join(traceback.format_stack(limit=6)[:-1])
+            stack = _format_stack(sys._getframe(2))
 
-        output_str, json_data = self._format(level, message, all_tags, location, stack)
-        self._write(output_str, json_data)
+        data, json_data = self._format(level, message, args, all_tags, location, stack)
+        self._write(data, json_data, level in self.FLUSH_LEVELS)
 
     def watch(self, **kwargs):
-        pairs = ", ".join(f"{k}={v!r}" for k, v in kwargs.items())
-        self.log("WATCH: " + pairs, level="DEBUG")
+        self.debug("WATCH: %s", _WatchPairs(kwargs))
 
     def assert_log(self, condition, message="Assertion failed"):
         if not condition:
-            self.log("ASSERT: " + message, level="ERROR", include_stack=True)
+            self.error("ASSERT: " + message, include_stack=True)
             raise AssertionError(message)
 
     def timeit(self, label=None):
@@ -159,45 +622,139 @@ class DebugLogger:
                 start = time.perf_counter()
                 result = fn(*args, **kwargs)
                 duration = (time.perf_counter() - start) * 1000
-                self.log(f"{label or fn.__name__} took {duration:.2f}ms", level="TIMER")
+                self.timer("%s took %.2fms", label or fn.__name__, duration)
                 return result
             return wrapper
         return decorator
 
+    def bind(self, module=None, tags=None):
+        return BoundLogger(self, module, tags)
+
     # === Configuration API ===
     def configure(self, **kwargs):
+        self._drain()
         for k, v in kwargs.items():
             setattr(self, k, v)
+        self._refresh()
 
-    def set_tags(self, *tags): self.tags = set(tags)
-    def clear_tags(self): self.tags.clear()
-    def enable_level(self, level): self.enabled_levels.add(level)
-    def disable_level(self, level): self.enabled_levels.discard(level)
+    def set_tags(self, *tags):
+        self.tags = frozenset(tags)
+        self._refresh()
+    def clear_tags(self):
+        self.tags = frozenset()
+        self._refresh()
+    def enable_level(self, level):
+        self.enabled_levels = self.enabled_levels | {level}
+        self._refresh()
+    def disable_level(self, level):
+        self.enabled_levels = self.enabled_levels - {level}
+        self._refresh()
     def enable_stack(self): self.include_stack = True
     def disable_stack(self): self.include_stack = False
-    def enable_colors(self): self.use_colors = True
-    def disable_colors(self): self.use_colors = False
+    def enable_colors(self):
+        self.use_colors = True
+        self._refresh()
+    def disable_colors(self):
+        self.use_colors = False
+        self._refresh()
     def enable_json(self): self.json_output = True
     def disable_json(self): self.json_output = False
     def enable_remote(self): self.remote_enabled = True
     def disable_remote(self): self.remote_enabled = False
     def set_output(self, mode, callback=None):
-        self.output = mode
-        self.callback = callback
-    def set_format(self, format_str): self.log_format = format_str
-    def set_whitelist(self, *modules): self.whitelist = set(modules)
+        self._drain()
+        with self.lock:
+            self.output = mode
+            self.callback = callback
+            if mode not in _FILE_MODES:
+                self._close_file()
+    def set_format(self, format_str):
+        self.log_format = format_str
+        self._refresh()
+    def set_whitelist(self, *modules):
+        self.whitelist = frozenset(modules)
+        self._refresh()
     def set_filters(self, levels=None, modules=None, functions=None, tags=None):
-        if levels is not None: self.filters["levels"] = set(levels)
-        if modules is not None: self.filters["modules"] = set(modules)
-        if functions is not None: self.filters["functions"] = set(functions)
-        if tags is not None: self.filters["tags"] = set(tags)
+        if levels is not None: self.filters["levels"] = frozenset(levels)
+        if modules is not None: self.filters["modules"] = frozenset(modules)
+        if functions is not None: self.filters["functions"] = frozenset(functions)
+        if tags is not None: self.filters["tags"] = frozenset(tags)
+        self._refresh()
     def set_remote_url(self, url): self.remote_url = url
+    def flush(self):
+        self._drain(force=True)
+        sender = self._sender
+        if sender is not None:
+            sender.wait_idle(timeout=5)
+        with self.lock:
+            if self._fh is not None:
+                self._fh.flush()
+    def close(self):
+        self._stop_worker()
+        self._drain(force=True)
+        self._stop_sender()
+        with self.lock:
+            self._close_file()
+
+def _bound_method(level):
+    def method(self, message, *args, tags=None, include_stack=None):
+        if self._version != self._logger._version:
+            self._rebind()
+        if level in self._enabled_levels:
+            self._logger._log_impl(
+                level, message, args, tags, include_stack, self._module, self._tags
+            )
+    method.__name__ = method.__qualname__ = level.lower()
+    return method
+
+# Snapshot of the parent's levels, tags and module filters, rebuilt when its config changes
+class BoundLogger:
+    __slots__ = ("_logger", "_module", "_extra_tags", "_tags", "_enabled_levels", "_version")
+
+    def __init__(self, logger, module=None, tags=None):
+        self._logger = logger
+        self._module = module
+        self._extra_tags = frozenset(tags or ())
+        self._rebind()
+
+    def _rebind(self):
+        logger = self._logger
+        self._version = logger._version
+        self._tags = logger.tags | self._extra_tags
+        module = self._module
+        modules = logger.filters["modules"]
+        if module is not None and (
+            (logger.whitelist and module not in logger.whitelist) or
+            (modules and module not in modules)
+        ):
+            self._enabled_levels = frozenset()
+        else:
+            self._enabled_levels = logger.enabled_levels
+
+    def log(self, message, *args, level="INFO", tags=None, include_stack=None):
+        if self._version != self._logger._version:
+            self._rebind()
+        if level in self._enabled_levels:
+            self._logger._log_impl(
+                level, message, args, tags, include_stack, self._module, self._tags
+            )
+
+    info = _bound_method("INFO")
+    debug = _bound_method("DEBUG")
+    warn = _bound_method("WARN")
+    error = _bound_method("ERROR")
+    timer = _bound_method("TIMER")
 
 # Singleton instance
 _logger = DebugLogger()
 
 # Public API
 log = _logger.log
+info = _logger.info
+debug = _logger.debug
+warn = _logger.warn
+error = _logger.error
+timer = _logger.timer
 watch = _logger.watch
 assert_log = _logger.assert_log
 timeit = _logger.timeit
@@ -219,4 +776,10 @@ set_format = _logger.set_format
 set_whitelist = _logger.set_whitelist
 set_filters = _logger.set_filters
 set_remote_url = _logger.set_remote_url
-get_logger = lambda: _logger
+flush = _logger.flush
+close = _logger.close
+
+def get_logger(module=None, tags=None):
+    if module is None and tags is None:
+        return _logger
+    return _logger.bind(module, tags)